@@ -1,39 +1,84 @@
+import sys
+from operator import itemgetter
 from typing import Any, Dict, Literal
-from src.catalog_manage import get_object_info, delete_object, get_container_by_name, modify_object
-from src.data_storage import save_json_file
+from src.catalog_manage import add_container_to_container, add_object_to_container, get_object_info, delete_object, get_container_by_name, modify_object, normalize_name, suggest_container_names
 
+_ADD_CHOICES: frozenset[str] = frozenset({"1", "2"})
 
-def explore_catalog(data: Dict[str, Any], path: list[str] | None = None) -> None:
+_ADD_PROMPTS: Dict[str, str] = {
+    
+    "objects": "Enter the name or path of the container where you want to add the object (e.g. 'kitchen', 'house > kitchen > pantry' or 'kitchen > pantry'): ",
+    
+    "containers": "Enter the name or path of the container where the new container should be added (e.g. 'kitchen', 'house > kitchen > pantry' or 'kitchen > pantry'): "
+}
+
+_ADD_ERRORS: Dict[str, str] = {
+    
+    "objects": "Container not found. Please try again!",
+    
+    "containers": "Container where you want to insert the new container not found. Please try again!"
+}
+
+
+
+def _ask(prompt: str) -> str:
+    """
+    Prompts the user for a line of input.
+
+    The answer is normalized here, once, in the same way names and categories
+    are normalized when the catalog is loaded, so it can be compared directly.
+
+    Parameters:
+        prompt (str): The message shown to the user.
+
+    Returns:
+        str: The user's answer with surrounding whitespace removed, case-folded.
     """
-    Recursively traverses the catalog and prints details of all objects.
+    return normalize_name(input(prompt))
+
 
-    Starts from the given node and explores all nested containers,
-    printing each object's name, category, and its full hierarchical path.
+
+def explore_catalog(data: Dict[str, Any]) -> None:
+    """
+    Traverses the catalog and prints details of all objects.
+
+    Explores all nested containers depth-first with an explicit stack,
+    collecting each object's name, category, and its full hierarchical path,
+    and writes the whole listing to standard output at once.
+    Containers are expected to have "objects" and "containers" lists and objects
+    both "name" and "category" keys, as ensured on load.
 
     Parameters:
-        data (Dict[str, Any]): The current node (container) in the catalog.
-        path (list[str] | None): The path of container names from the root to the current node.
-                                 Defaults to None, which initializes the path with the root name.
+        data (Dict[str, Any]): The root node (container) of the catalog.
 
     Returns:
         None
-    """    
-    if path is None:
-        
-        path = [data.get("name", "house")]
+    """
+    separator = "-" * 50
+    
+    name_and_category = itemgetter("name", "category")
+    
+    lines: list[str] = []
+    
+    stack: list[tuple[Dict[str, Any], tuple[str, ...]]] = [(data, (data.get("name", "house"),))]
 
-    for object in data.get("objects", []):
+    while stack:
         
-        print(f"Name: {object.get("name", "")}")
-        print(f"Category: {object.get("category", "")}")
-        print(f"Location: {" > ".join(path)}")
-        print("-" * 50)
-
-    for container in data.get("containers", []):
+        node, path = stack.pop()
         
-        new_path = path + [container.get("name", "")]
+        location = f"Location: {" > ".join(path)}"
         
-        explore_catalog(container, new_path)   
+        for name, category in map(name_and_category, node["objects"]):
+            
+            lines.append(f"Name: {name}\nCategory: {category}\n{location}\n{separator}")
+
+        for container in reversed(node["containers"]):
+            
+            stack.append((container, path + (container.get("name", ""),)))
+
+    if lines:
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 
@@ -50,7 +95,7 @@ def search_object_in_catalog(data: Dict[str, Any]) -> None:
     Returns:
         None
     """        
-    object_name = input("Enter the name of the object to search: ").strip().lower()
+    object_name = _ask("Enter the name of the object to search: ")
     
     object_info = get_object_info(data, object_name)
     
@@ -64,62 +109,61 @@ def search_object_in_catalog(data: Dict[str, Any]) -> None:
 
 
 
-def delete_object_from_catalog(data: Dict[str, Any], file_name: str) -> None:
+def delete_object_from_catalog(data: Dict[str, Any]) -> bool:
     """
     Prompts the user to delete an object from the catalog by name.
 
-    If the object is found and deleted, the catalog is saved to file.
-    Otherwise, an error message is displayed.
+    If the object is not found, an error message is displayed.
+    Saving the updated catalog is left to the caller.
 
     Parameters:
         data (Dict[str, Any]): The catalog data structure.
-        file_name (str): The file path where the updated catalog should be saved.
 
     Returns:
-        None
+        bool: True if the object was deleted, False otherwise.
     """
-    object_name = input("Enter the name of the object to delete: ").strip().lower()
+    object_name = _ask("Enter the name of the object to delete: ")
     
     if delete_object(data, object_name):
         
-        save_json_file(data, file_name)
-        
         print("Object successfully deleted from the catalog!")
+        
+        return True
 
-    else:
-        print(f"Object not found in the catalog!")
+    print(f"Object not found in the catalog!")
+    
+    return False
 
 
 
-def modify_object_in_catalog(data: Dict[str, Any], file_name: str) -> None:
+def modify_object_in_catalog(data: Dict[str, Any]) -> bool:
     """
     Allows the user to modify an object's name and/or category in the catalog.
 
-    If the object is found, its data is updated and the catalog is saved.
+    If the object is found, its data is updated in memory; saving is left to the caller.
     Otherwise, a message is shown indicating that the object was not found.
 
     Parameters:
         data (Dict[str, Any]): The catalog structure.
-        file_name (str): The file path where the updated catalog should be saved.
 
     Returns:
-        None
+        bool: True if the object was modified, False otherwise.
     """
-    object_name = input("Enter the name of the object to modify: ").strip().lower()
+    object_name = _ask("Enter the name of the object to modify: ")
     
-    new_object_name = input("Enter the new name of the object (blank line to keep it unchanged): ").strip().lower()
+    new_object_name = _ask("Enter the new name of the object (blank line to keep it unchanged): ")
     
-    new_category_name = input("Enter the new category of the object (blank line to keep it unchanged): ").strip().lower()
+    new_category_name = _ask("Enter the new category of the object (blank line to keep it unchanged): ")
     
     if modify_object(data, object_name, new_object_name, new_category_name):
         
-        save_json_file(data, file_name)
-        
         print("Object successfully modified in the catalog!")
-    
-    else:
         
-        print(f"Object not found in the catalog!")
+        return True
+    
+    print(f"Object not found in the catalog!")
+    
+    return False
     
 
 
@@ -127,7 +171,10 @@ def get_container_for_adding(data: Dict[str, Any], key: Literal["objects", "cont
     """
     Prompts the user to select a container by name for adding an object or a new container.
 
-    Performs recursive search until a valid container is found.
+    The container can be given by name, or by a path starting at the root or at any container.
+    Keeps prompting until a valid container is found, suggesting similar container
+    names after each failed attempt. Each attempt is a single lookup in the catalog's
+    container indices; catalogs loaded without an index fall back to a search of the tree.
 
     Parameters:
         data (Dict[str, Any]): The catalog structure.
@@ -138,23 +185,13 @@ def get_container_for_adding(data: Dict[str, Any], key: Literal["objects", "cont
     Returns:
         Dict[str, Any]: The container where the object or new container will be added.
     """
-    prompt = {
-        
-        "objects": "Enter the name of the container where you want to add the object (e.g. 'house', 'kitchen'): ",
-        
-        "containers": "Enter the name of the container where the new container should be added (e.g. 'house', 'kitchen'): "
-    }
-    
-    error_message = {
-        
-        "objects": "Container not found. Please try again!",
+    while not (container := get_container_by_name(data, container_name := _ask(_ADD_PROMPTS[key]))):
+            
+        print(_ADD_ERRORS[key])
         
-        "containers": "Container where you want to insert the new container not found. Please try again!"
-    }
-    
-    while not (container := get_container_by_name(data, input(prompt[key]).strip().lower())):
+        if suggestions := suggest_container_names(data, container_name):
             
-        print(error_message[key])
+            print(f"Did you mean: {", ".join(suggestions)}?")
 
     return container
 
@@ -167,23 +204,20 @@ def create_new_object() -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary representing the new object.
     """
-    object_name = input("Enter the name of the object to add to the catalog: ").strip().lower()
+    object_name = _ask("Enter the name of the object to add to the catalog: ")
 
-    object_category = input("Enter the category of the object to add: ").strip().lower()
+    object_category = _ask("Enter the category of the object to add: ")
     
-    return {"name": object_name, "category": object_category}  
+    return {"name": sys.intern(object_name), "category": sys.intern(object_category)}  
 
 
 
-def add_object(data: Dict[str, Any], file_name: str) -> None:
+def add_object(data: Dict[str, Any]) -> None:
     """
     Creates a new object and adds it to a user-selected existing container.
 
-    Saves the updated catalog to the specified file.
-
     Parameters:
         data (Dict[str, Any]): The catalog structure.
-        file_name (str): The file path where the updated catalog should be saved.
 
     Returns:
         None
@@ -192,32 +226,30 @@ def add_object(data: Dict[str, Any], file_name: str) -> None:
         
     container: Dict[str, Any] = get_container_for_adding(data, "objects")
     
-    container.get("objects", []).append(new_object)
-    
-    save_json_file(data, file_name)
+    add_object_to_container(data, container, new_object)
     
     print("Object successfully added to the catalog!")
     
     
     
-def add_object_in_catalog(data: Dict[str, Any], file_name) -> None:
+def add_object_in_catalog(data: Dict[str, Any]) -> bool:
     """
     Handles object addition, either to an existing container or by creating a new container.
 
     Prompts the user to choose between adding the object to an existing container (option 1),
     or creating a new container and adding the object inside it (option 2).
+    Saving the updated catalog is left to the caller.
 
     Parameters:
         data (Dict[str, Any]): The catalog structure.
-        file_name (str): The file path where the updated catalog should be saved.
 
     Returns:
-        None
+        bool: True, since the catalog is always modified.
     """
     print("Press [1] to add an object to an existing container.")
     print("Press [2] to create a new container and add an object to it.")
 
-    while not (user_choice := input("\nChoose an option: ").strip()) in ["1", "2"]:
+    while (user_choice := input("\nChoose an option: ").strip()) not in _ADD_CHOICES:
         
         print("Invalid input. Please enter 1 or 2!")
         
@@ -225,22 +257,22 @@ def add_object_in_catalog(data: Dict[str, Any], file_name) -> None:
         
         case "1":
             
-            add_object(data, file_name)
+            add_object(data)
         
         case "2":
             
-            new_container_name = input("Enter the name of the new container: ").strip().lower()
+            new_container_name = _ask("Enter the name of the new container: ")
             
             new_container: Dict[str, Any] = {"name": new_container_name, "objects": [], "containers": []}
 
             container: Dict[str, Any] = get_container_for_adding(data, "containers")
     
-            container.get("containers", []).append(new_container)
+            add_container_to_container(data, container, new_container)
             
             new_object: Dict[str, str] = create_new_object()
             
-            new_container.get("objects", []).append(new_object)
-    
-            save_json_file(data, file_name)
+            add_object_to_container(data, new_container, new_object)
             
-            print("New container and object successfully added to the catalog!")  
+            print("New container and object successfully added to the catalog!")
+    
+    return True  
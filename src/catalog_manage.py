@@ -1,32 +1,419 @@
-from typing import Any, Dict, List
+import difflib
+import sys
+from typing import Any, Dict, List, Tuple
+
+INDEX_KEYS: Tuple[str, ...] = ("_obj_idx", "_ctr_idx", "_ctr_paths", "_ctr_by_path", "_ctr_order", "_ctr_trie", "_version")
+
+# Shared default for the searches on catalogs without an index, whose containers
+# may lack "objects" or "containers": unlike a [] literal it is never reallocated.
+_EMPTY: Tuple[()] = ()
+
+
+def normalize_name(text: Any) -> str:
+    """
+    Normalizes a name or category so that it can be compared with plain equality.
+
+    Values read from a catalog file may not be strings: null becomes an empty string
+    and any other value is converted with str().
+
+    Parameters:
+        text (Any): The text to normalize.
+
+    Returns:
+        str: The text with surrounding whitespace removed, case-folded.
+    """
+    if not isinstance(text, str):
+        
+        text = "" if text is None else str(text)
+    
+    return text.strip().casefold()
+
+
+
+def build_catalog_index(data: Dict[str, Any]) -> None:
+    """
+    Builds the name indices used to look up objects and containers in constant time.
+
+    The catalog is walked once, depth-first in pre-order, so each name maps to the same
+    first match as the searches without an index. Missing "objects" and "containers" lists
+    are added, names and categories are normalized and object strings are interned.
+    The indices are attached to the catalog itself:
+
+    - "_obj_idx": object name -> list of (object, container, path, position) entries, in pre-order.
+    - "_ctr_idx": container name -> first container with that name (nameless containers are left out).
+    - "_ctr_paths": container id -> path of names from the root.
+    - "_ctr_by_path": path of names -> container.
+    - "_ctr_order": container id -> pre-order position, as the child indices from the root.
+    - "_ctr_trie": character trie of the container names, used for suggestions.
+    - "_version": number of changes made since indexing.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+
+    Returns:
+        None
+    """
+    objects_by_name: Dict[str, List[Tuple[Dict[str, str], Dict[str, Any], Tuple[str, ...], int]]] = {}
+    
+    containers_by_name: Dict[str, Dict[str, Any]] = {}
+    
+    container_paths: Dict[int, Tuple[str, ...]] = {}
+    
+    containers_by_path: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    
+    container_order: Dict[int, Tuple[int, ...]] = {}
+    
+    container_trie: Dict[str, Any] = {}
+    
+    stack: List[Tuple[Dict[str, Any], Tuple[str, ...], Tuple[int, ...]]] = [(data, (), ())]
+    
+    while stack:
+        
+        container, parent_path, order = stack.pop()
+        
+        if "name" in container:
+            
+            container["name"] = normalize_name(container["name"])
+        
+        name = container.get("name", "")
+        
+        path = parent_path + (name,)
+        
+        if name and name not in containers_by_name:
+            
+            containers_by_name[name] = container
+            
+            _add_to_trie(container_trie, name)
+        
+        container_paths[id(container)] = path
+        
+        containers_by_path.setdefault(path, container)
+        
+        container_order[id(container)] = order
+        
+        objects_list = container.setdefault("objects", [])
+        
+        for position, object in enumerate(objects_list):
+            
+            object["name"] = sys.intern(normalize_name(object.get("name", "")))
+            
+            object["category"] = sys.intern(normalize_name(object.get("category", "")))
+            
+            objects_by_name.setdefault(object["name"], []).append((object, container, path, position))
+        
+        children = container.setdefault("containers", [])
+        
+        for index in reversed(range(len(children))):
+            
+            stack.append((children[index], path, order + (index,)))
+
+    data["_obj_idx"] = objects_by_name
+    
+    data["_ctr_idx"] = containers_by_name
+    
+    data["_ctr_paths"] = container_paths
+    
+    data["_ctr_by_path"] = containers_by_path
+    
+    data["_ctr_order"] = container_order
+    
+    data["_ctr_trie"] = container_trie
+    
+    data["_version"] = 0
+
+
+
+def _mark_modified(data: Dict[str, Any]) -> None:
+    """
+    Records a change to an indexed catalog by bumping its "_version" counter.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+
+    Returns:
+        None
+    """
+    if "_version" in data:
+        
+        data["_version"] += 1
+
+
+
+def _find_position(objects_list: List[Dict[str, str]], object: Dict[str, str], position: int) -> int:
+    """
+    Finds the current position of an object in its list.
+
+    The position recorded in the index is only a hint, since earlier deletions may
+    have shifted the list; it is checked by identity before falling back to a scan.
+
+    Parameters:
+        objects_list (List[Dict[str, str]]): The list holding the object.
+        object (Dict[str, str]): The object to find.
+        position (int): The recorded position of the object.
+
+    Returns:
+        int: The index of the object in the list.
+    """
+    if position < len(objects_list) and objects_list[position] is object:
+        
+        return position
+    
+    return next(index for index, item in enumerate(objects_list) if item is object)
+
+
+
+def _object_order(data: Dict[str, Any], entry: Tuple[Dict[str, str], Dict[str, Any], Tuple[str, ...], int]) -> Tuple[Tuple[int, ...], int]:
+    """
+    Gives the depth-first pre-order position of an indexed object, for sorting entries.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        entry (Tuple[Dict[str, str], Dict[str, Any], Tuple[str, ...], int]): The (object, container, path, position) entry.
+
+    Returns:
+        Tuple[Tuple[int, ...], int]: The pre-order position of the container and the object's index in it.
+    """
+    object, container, _, position = entry
+    
+    return (data["_ctr_order"][id(container)], _find_position(container["objects"], object, position))
+
+
+
+def _index_object(data: Dict[str, Any], entry: Tuple[Dict[str, str], Dict[str, Any], Tuple[str, ...], int]) -> None:
+    """
+    Inserts an entry in the object name index, keeping entries with the same name
+    in depth-first pre-order, so the first one is the match a full search would find.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        entry (Tuple[Dict[str, str], Dict[str, Any], Tuple[str, ...], int]): The (object, container, path, position) entry.
+
+    Returns:
+        None
+    """
+    entries = data["_obj_idx"].setdefault(entry[0]["name"], [])
+    
+    entry_order = _object_order(data, entry)
+    
+    index = len(entries)
+    
+    while index and _object_order(data, entries[index - 1]) > entry_order:
+        
+        index -= 1
+    
+    entries.insert(index, entry)
+
+
+
+def _add_to_trie(trie: Dict[str, Any], name: str) -> None:
+    """
+    Inserts a name into a character trie made of nested dictionaries.
+
+    Each character leads to a nested dictionary; the empty-string key marks
+    the end of a name and holds the full name.
+
+    Parameters:
+        trie (Dict[str, Any]): The root of the trie.
+        name (str): The name to insert.
+
+    Returns:
+        None
+    """
+    node = trie
+    
+    for character in name:
+        
+        node = node.setdefault(character, {})
+    
+    node[""] = name
+
+
+
+def suggest_container_names(data: Dict[str, Any], container_name: str, limit: int = 3) -> List[str]:
+    """
+    Suggests existing container names for a name that was not found.
+
+    Names starting with the given text are suggested first, found by walking the
+    container trie, followed by similar names according to difflib. For a path
+    whose leading part names a container (e.g. "kitchen > pantr"), the paths to
+    its matching child containers are suggested instead.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        container_name (str): The container name or path that was not found.
+        limit (int, optional): The maximum number of suggestions. Defaults to 3.
+
+    Returns:
+        List[str]: The suggested names or paths, or an empty list if nothing matches
+                   or the catalog has no index.
+    """
+    head, separator, last = container_name.rpartition(">")
+    
+    if separator:
+        
+        head, last = head.strip(), last.strip()
+        
+        if (parent := get_container_by_name(data, head)) is not None:
+            
+            names = [name for container in parent.get("containers", _EMPTY) if (name := container.get("name", ""))]
+            
+            matches = [name for name in names if name.startswith(last)] + difflib.get_close_matches(last, names, n=limit)
+            
+            return [f"{head} > {name}" for name in dict.fromkeys(matches)][:limit]
+        
+        container_name = last
+    
+    if "_ctr_trie" not in data:
+        
+        return []
+    
+    suggestions: List[str] = []
+    
+    node = data["_ctr_trie"]
+    
+    for character in container_name:
+        
+        node = node.get(character)
+        
+        if node is None:
+            
+            break
+    
+    else:
+        
+        stack = [node]
+        
+        while stack and len(suggestions) < limit:
+            
+            node = stack.pop()
+            
+            if "" in node:
+                
+                suggestions.append(node[""])
+            
+            stack.extend(child for character, child in sorted(node.items(), reverse=True) if character)
+    
+    for name in difflib.get_close_matches(container_name, data["_ctr_idx"].keys(), n=limit):
+        
+        if len(suggestions) < limit and name not in suggestions:
+            
+            suggestions.append(name)
+    
+    return suggestions
+
+
+
+def add_object_to_container(data: Dict[str, Any], container: Dict[str, Any], new_object: Dict[str, str]) -> None:
+    """
+    Appends an object to a container and registers it in the catalog's name index.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        container (Dict[str, Any]): The container that will hold the object.
+        new_object (Dict[str, str]): The object to add.
+
+    Returns:
+        None
+    """
+    objects_list = container.setdefault("objects", [])
+    
+    objects_list.append(new_object)
+    
+    _mark_modified(data)
+    
+    if "_obj_idx" in data:
+        
+        _index_object(data, (new_object, container, data["_ctr_paths"][id(container)], len(objects_list) - 1))
+
+
+
+def add_container_to_container(data: Dict[str, Any], container: Dict[str, Any], new_container: Dict[str, Any]) -> None:
+    """
+    Appends a new container inside an existing one and registers it in the catalog's name index.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        container (Dict[str, Any]): The container that will hold the new container.
+        new_container (Dict[str, Any]): The container to add.
+
+    Returns:
+        None
+    """
+    children = container.setdefault("containers", [])
+    
+    children.append(new_container)
+    
+    _mark_modified(data)
+    
+    if "_ctr_idx" in data:
+        
+        name = new_container["name"]
+        
+        order = data["_ctr_order"][id(container)] + (len(children) - 1,)
+        
+        data["_ctr_order"][id(new_container)] = order
+        
+        existing = data["_ctr_idx"].get(name)
+        
+        # An earlier container in pre-order takes over the name, as it would after a reload.
+        if name and (existing is None or order < data["_ctr_order"][id(existing)]):
+            
+            if existing is None:
+                
+                _add_to_trie(data["_ctr_trie"], name)
+            
+            data["_ctr_idx"][name] = new_container
+        
+        path = data["_ctr_paths"][id(container)] + (new_container["name"],)
+        
+        data["_ctr_paths"][id(new_container)] = path
+        
+        data["_ctr_by_path"].setdefault(path, new_container)
+
 
 
 def get_object_info(data: Dict[str, Any], object_to_search: str) -> List[str]:
     """
-    Recursively searches for an object in the catalog and returns its name, category, and location path.
+    Searches for an object in the catalog and returns its name, category, and location path.
+
+    Uses the name index when the catalog has one, otherwise searches the containers
+    depth-first with an explicit stack.
 
     Parameters:
-        node (dict): The current node (container) in the catalog.
-        target_object (str): The name of the object to search for.
+        data (Dict[str, Any]): The catalog data structure to search in.
+        object_to_search (str): The name of the object to search for.
 
     Returns:
         list: A list containing [object_name, category, container names from inner to outer].
               Returns an empty list if the object is not found.
     """
-    
-    for object in data.get("objects", []):
+    if "_obj_idx" in data:
         
-        if object_to_search == object.get("name"):
+        entries = data["_obj_idx"].get(object_to_search)
+        
+        if not entries:
             
-            return [object["name"], object["category"], data["name"]]
+            return []
+        
+        object, _, path, _ = entries[0]
+        
+        return [object["name"], object["category"], *path[::-1]]
+    
+    stack: List[Tuple[Dict[str, Any], Tuple[str, ...]]] = [(data, (data.get("name", ""),))]
+    
+    while stack:
         
-    for container in data.get("containers", []):
+        node, path = stack.pop()
         
-        result = get_object_info(container, object_to_search)
+        for object in node.get("objects", _EMPTY):
+            
+            if object_to_search == object.get("name"):
+                
+                return [object["name"], object["category"], *path[::-1]]
         
-        if result:
+        for container in reversed(node.get("containers", _EMPTY)):
             
-            return result + [data["name"]]
+            stack.append((container, path + (container.get("name", ""),)))
 
     return []
 
@@ -36,8 +423,8 @@ def delete_object(data: Dict[str, Any], object_name: str) -> bool:
     """
     Delete an object from the nested catalog structure.
 
-    This function performs a recursive search through all containers
-    to find and remove the specified object.
+    The object is located through the name index when the catalog has one,
+    otherwise all containers are searched depth-first with an explicit stack.
 
     Parameters:
         data: The catalog data (nested dictionary).
@@ -46,22 +433,43 @@ def delete_object(data: Dict[str, Any], object_name: str) -> bool:
     Returns:
         True if the object was deleted, False otherwise.
     """
-    
-    objects_list = data.get("objects", [])
-    
-    for object in objects_list:
+    if "_obj_idx" in data:
         
-        if object.get("name") == object_name:
+        entries = data["_obj_idx"].get(object_name)
+        
+        if not entries:
             
-            objects_list.remove(object)
+            return False
+        
+        object, container, _, position = entries.pop(0)
+        
+        if not entries:
             
-            return True
-
-    for container in data.get("containers", []):
+            del data["_obj_idx"][object_name]
         
-        if delete_object(container, object_name):
+        del container["objects"][_find_position(container["objects"], object, position)]
+        
+        _mark_modified(data)
+        
+        return True
+    
+    stack: List[Dict[str, Any]] = [data]
+    
+    while stack:
+        
+        node = stack.pop()
+        
+        objects_list = node.get("objects", _EMPTY)
+        
+        for position, object in enumerate(objects_list):
             
-            return True
+            if object.get("name") == object_name:
+                
+                del objects_list[position]
+                
+                return True
+        
+        stack.extend(reversed(node.get("containers", _EMPTY)))
 
     return False
 
@@ -69,7 +477,10 @@ def delete_object(data: Dict[str, Any], object_name: str) -> bool:
 
 def get_object(data: Dict[str, Any], object_name: str) -> Dict[str, str] | None:
     """
-    Recursively searches for an object by name in the catalog.
+    Searches for an object by name in the catalog.
+
+    Uses the name index when the catalog has one, otherwise searches the containers
+    depth-first with an explicit stack.
 
     Parameters:
         data (Dict[str, Any]): The catalog data structure.
@@ -78,19 +489,25 @@ def get_object(data: Dict[str, Any], object_name: str) -> Dict[str, str] | None:
     Returns:
         Dict[str, str] | None: The object dictionary if found, otherwise None.
     """
-    for object in data.get("objects", []):
+    if "_obj_idx" in data:
         
-        if object.get("name") == object_name:
-            
-            return object
+        entries = data["_obj_idx"].get(object_name)
+        
+        return entries[0][0] if entries else None
     
-    for container in data.get("containers", []):
+    stack: List[Dict[str, Any]] = [data]
+    
+    while stack:
         
-        result = get_object(container, object_name)
+        node = stack.pop()
         
-        if result:
+        for object in node.get("objects", _EMPTY):
             
-            return result
+            if object.get("name") == object_name:
+                
+                return object
+        
+        stack.extend(reversed(node.get("containers", _EMPTY)))
     
     return None
 
@@ -115,13 +532,27 @@ def modify_object(data: Dict[str, Any], object_name: str, new_object_name: str =
         
         return False
     
-    if new_object_name:
+    _mark_modified(data)
+    
+    if new_object_name and new_object_name != object_name:
+        
+        object["name"] = sys.intern(new_object_name)
         
-        object["name"] = new_object_name
+        if "_obj_idx" in data:
+            
+            entries = data["_obj_idx"][object_name]
+            
+            entry = entries.pop(0)
+            
+            if not entries:
+                
+                del data["_obj_idx"][object_name]
+            
+            _index_object(data, entry)
         
     if new_category_name: 
         
-        object["category"] = new_category_name
+        object["category"] = sys.intern(new_category_name)
         
     return True
 
@@ -129,22 +560,106 @@ def modify_object(data: Dict[str, Any], object_name: str, new_object_name: str =
 
 def get_container_by_name(data: Dict[str, Any], container_name: str) -> Dict[str, Any] | None:
     """
-    Recursively searches for a container by name within the catalog structure.
-    Searches the current node and all nested containers until a match is found.
+    Searches for a container by name within the catalog structure.
+    Uses the name index when the catalog has one, otherwise searches the current node
+    and all nested containers depth-first, with an explicit stack, until a match is found.
+
+    A path written like the locations shown in the catalog selects one container
+    even when several share the same name. It can start at the root
+    (e.g. "house > kitchen > pantry") or at any container found by name
+    (e.g. "kitchen > pantry"); if it matches neither, it is looked up as a plain name.
 
     Parameters:
         data (Dict[str, Any]): The catalog data structure to search in.
-        container_name (str): The name of the container to locate.
+        container_name (str): The name or path of the container to locate.
 
     Returns:
         Dict[str, Any] | None: The container dictionary if found, otherwise None.
     """
-    if data.get("name") == container_name:
-        return data
-
-    for container in data.get("containers", []):
-        result = get_container_by_name(container, container_name)
-        if result:
-            return result
+    if ">" in container_name:
+        
+        path = tuple(name.strip() for name in container_name.split(">"))
+        
+        container = get_container_by_path(data, path)
+        
+        if container is None and (start := get_container_by_name(data, path[0])) is not None:
+            
+            container = _follow_path(data, start, path[1:])
+        
+        if container is not None:
+            
+            return container
+    
+    if "_ctr_idx" in data:
+        
+        return data["_ctr_idx"].get(container_name)
+    
+    stack: List[Dict[str, Any]] = [data]
+    
+    while stack:
+        
+        node = stack.pop()
+        
+        if node.get("name") == container_name:
+            
+            return node
+        
+        stack.extend(reversed(node.get("containers", _EMPTY)))
 
     return None
+
+
+
+def _follow_path(data: Dict[str, Any], start: Dict[str, Any], names: Tuple[str, ...]) -> Dict[str, Any] | None:
+    """
+    Finds a container from its path of names below a given container.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        start (Dict[str, Any]): The container the path starts from.
+        names (Tuple[str, ...]): The container names from below the start to the container.
+
+    Returns:
+        Dict[str, Any] | None: The container dictionary if found, otherwise None.
+    """
+    if "_ctr_by_path" in data:
+        
+        return data["_ctr_by_path"].get(data["_ctr_paths"][id(start)] + names)
+    
+    node = start
+    
+    for name in names:
+        
+        node = next((container for container in node.get("containers", _EMPTY) if container.get("name", "") == name), None)
+        
+        if node is None:
+            
+            return None
+
+    return node
+
+
+
+def get_container_by_path(data: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any] | None:
+    """
+    Finds a container from its path of names, starting with the root's name.
+
+    Uses the path index when the catalog has one, otherwise follows the path
+    down from the root one level at a time.
+
+    Parameters:
+        data (Dict[str, Any]): The root of the catalog data structure.
+        path (Tuple[str, ...]): The container names from the root to the container.
+
+    Returns:
+        Dict[str, Any] | None: The container dictionary if found, otherwise None.
+    """
+    if "_ctr_by_path" in data:
+        
+        return data["_ctr_by_path"].get(path)
+    
+    if not path or data.get("name", "") != path[0]:
+        
+        return None
+    
+    return _follow_path(data, data, path[1:])
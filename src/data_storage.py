@@ -1,49 +1,196 @@
 import json
-from typing import Any, Dict
+import mmap
+import os
+import stat
+import tempfile
+from typing import Any, Dict, Tuple
+from src.catalog_manage import INDEX_KEYS, build_catalog_index
 
+try:
+    import orjson
     
-def load_json_file(file_name: str) -> Dict[str, Any]:
+except ImportError:
+    orjson = None
+
+_MMAP_THRESHOLD: int = 1024 * 1024
+
+_cache: Dict[Tuple[str, int, int], Tuple[Dict[str, Any], int]] = {}
+
+
+
+def _cache_key(file_name: str) -> Tuple[str, int, int]:
+    """
+    Builds the key identifying the current version of a file in the load cache.
+
+    Args:
+        file_name (str): The path to the file.
+
+    Returns:
+        Tuple[str, int, int]: The absolute path, modification time in nanoseconds and size of the file.
+    """
+    status = os.stat(file_name)
+    
+    return (os.path.abspath(file_name), status.st_mtime_ns, status.st_size)
+
+
+
+def _forget_cached_file(file_name: str) -> None:
+    """
+    Removes every cached version of a file from the load cache.
+
+    Args:
+        file_name (str): The path to the file.
+
+    Returns:
+        None
+    """
+    path = os.path.abspath(file_name)
+    
+    for cache_key in [cache_key for cache_key in _cache if cache_key[0] == path]:
+        
+        del _cache[cache_key]
+
+    
+def load_json_file(file_name: str) -> Tuple[Dict[str, Any], bool]:
     
     """
-    Loads and parses a JSON file into a Python dictionary.
+    Loads and parses a JSON file into a Python dictionary and builds its name indices.
+
+    - Parsed with orjson when installed (memory-mapped above 1 MB), otherwise with json.
+    - Cached by path, modification time and size; the cached dictionary is reused
+      only if it has not been modified since.
 
     Args:
         file_name (str): The path to the JSON file to be loaded.
 
     Returns:
-        Dict[str, Any]: The parsed JSON content as a dictionary.
-                        Returns an empty dictionary if the file is not found
-                        or if the content is not valid JSON.
+        Tuple[Dict[str, Any], bool]: The parsed JSON content as a dictionary, and whether it was loaded.
+                                     If the file is not found, is not valid JSON or is not
+                                     a JSON object, an empty catalog is returned with False.
     """
     try:
-        with open(file_name, mode="r") as input_file:
-            return json.load(input_file)
+        cache_key = _cache_key(file_name)
+        
+        if cache_key in _cache:
+            
+            cached_data, version = _cache[cache_key]
+            
+            if cached_data["_version"] == version:
+                
+                return cached_data, True
+        
+        with open(file_name, mode="rb") as input_file:
+            
+            if orjson and cache_key[2] > _MMAP_THRESHOLD:
+                
+                with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as content:
+                    
+                    data = orjson.loads(content)
+            
+            else:
+                
+                content = input_file.read()
+                
+                data = orjson.loads(content) if orjson else json.loads(content)
         
     except FileNotFoundError:
         print(f"Errore: il file '{file_name}' non è stato trovato.")
-        return {}
+        data, cache_key = {}, None
     
     except json.JSONDecodeError as error:
         print(f"Errore di decodifica JSON nel file '{file_name}': {error}")
-        return {}
+        data, cache_key = {}, None
+    
+    if not isinstance(data, dict):
+        print(f"Errore di decodifica JSON nel file '{file_name}': il contenuto non è un oggetto JSON.")
+        data, cache_key = {}, None
+    
+    build_catalog_index(data)
+    
+    if cache_key:
         
+        _forget_cached_file(file_name)
+        
+        _cache[cache_key] = (data, data["_version"])
     
-def save_json_file(data: Dict[str, Any], file_name: str) -> None:
+    return data, cache_key is not None
+        
+    
+def save_json_file(data: Dict[str, Any], file_name: str, pretty: bool = False) -> bool:
     """
     Saves a Python dictionary to a JSON file.
 
+    - The index keys in INDEX_KEYS are not written.
+    - Serialized with orjson when installed, otherwise streamed with json.
+    - Written to a temporary file that atomically replaces the destination,
+      keeping its permissions.
+
     Args:
         data (Dict[str, Any]): The data to be written to the JSON file.
         file_name (str): The path to the destination JSON file.
+        pretty (bool): If True, the JSON is indented for readability
+                       (2 spaces with orjson, 4 with json). Defaults to False.
 
     Returns:
-        None
+        bool: True if the file was written, False if an error occurred.
     """
+    catalog = {key: value for key, value in data.items() if key not in INDEX_KEYS}
+    
+    temporary_name = None
+    
     try:
-        with open(file_name, mode="w") as output_file:
+        with tempfile.NamedTemporaryFile(mode="wb", dir=os.path.dirname(file_name) or ".", delete=False) as output_file:
+            
+            temporary_name = output_file.name
+            
+            if orjson:
+                
+                output_file.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2 if pretty else 0))
             
-            json.dump(data, output_file, indent = 4)
+            else:
+                
+                indent = 4 if pretty else None
+                
+                separators = None if pretty else (",", ":")
+                
+                encoder = json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False)
+                
+                for chunk in encoder.iterencode(catalog):
+                    
+                    output_file.write(chunk.encode("utf-8"))
+            
+            output_file.flush()
+            
+            os.fsync(output_file.fileno())
+        
+        # The temporary file is created private (0600); keep the permissions of the file it replaces.
+        if os.path.exists(file_name):
+            
+            os.chmod(temporary_name, stat.S_IMODE(os.stat(file_name).st_mode))
+        
+        os.replace(temporary_name, file_name)
             
     except (OSError, TypeError) as error:
         
-        print(f"Errore durante il salvataggio del file JSON: {error}")
\ No newline at end of file
+        print(f"Errore durante il salvataggio del file JSON: {error}")
+        
+        if temporary_name and os.path.exists(temporary_name):
+            
+            os.remove(temporary_name)
+        
+        return False
+    
+    _forget_cached_file(file_name)
+    
+    if "_version" in data:
+        
+        try:
+            cache_key = _cache_key(file_name)
+        
+        except OSError:
+            # The catalog was saved; it just cannot be cached.
+            return True
+        
+        _cache[cache_key] = (data, data["_version"])
+    
+    return True
@@ -1,49 +1,118 @@
+import atexit
+import sys
 from typing import Any, Dict
-from src.data_storage import load_json_file
+from src.data_storage import load_json_file, save_json_file
 from src.catalog_interface import add_object_in_catalog, delete_object_from_catalog, explore_catalog, modify_object_in_catalog, search_object_in_catalog
 
 file_name: str = "data/house_catalog.json"
 
-data: Dict[str, Any] = load_json_file(file_name)
+data: Dict[str, Any]
 
-menu_options: Dict[int, str] = {
+_loaded: bool
+
+data, _loaded = load_json_file(file_name)
+
+_dirty: bool = False
+
+menu_options: Dict[str, str] = {
     "1": "view all objects in the catalog.",
     "2": "search for an object by name.",
     "3": "add a new object to the catalog.",
     "4": "edit an existing object.",
     "5": "delete an object from the catalog.",
+    "0": "save and quit.",
 }
 
+_MENU: str = "\n" + "".join(f"Press [{key}] to {option}\n" for key, option in menu_options.items())
+
+
+def display_menu_options() -> None:
+    
+    sys.stdout.write(_MENU)
+
 
-def display_menu_options(menu_options: Dict[int, str]) -> None:
+
+def confirm_overwrite() -> bool:
+    """
+    Asks the user whether to save over a catalog file that could not be loaded.
+
+    Returns:
+        bool: True if the user confirmed, False otherwise (including when no answer can be read).
+    """
+    try:
+        answer = input(f"The file '{file_name}' could not be loaded: saving will replace its contents. Save anyway? [y/N]: ")
     
-    print("Welcome to the Cataloger of Household Objects!\n")
+    except EOFError:
+        return False
+    
+    return answer.strip().lower() == "y"
+
+
+
+def save_catalog_if_dirty() -> bool:
+    """
+    Writes the catalog to file if it was modified since it was loaded.
+
+    Called when the user quits, and registered with atexit so that changes are
+    also flushed if the program ends some other way. If the file could not be
+    loaded, it is only overwritten after the user confirms; otherwise the
+    changes are discarded and the file is left untouched.
 
-    for key, option in menu_options.items():
+    Returns:
+        bool: True if there are no unsaved changes left, False if saving failed.
+    """
+    global _dirty, _loaded
+
+    if _dirty and not _loaded and not confirm_overwrite():
+        
+        print("Changes discarded: the catalog file was left untouched.")
         
-        print(f"Press [{key}] to {option}")
+        _dirty = False
 
+    if _dirty and save_json_file(data, file_name):
+        
+        _dirty = False
+        
+        _loaded = True
+    
+    return not _dirty
 
 
-def main() -> None:
+atexit.register(save_catalog_if_dirty)
 
-    display_menu_options(menu_options)
 
-    while not (user_choice := input("\nChoose an option: ").strip()) in menu_options:
-        print("Invalid input. Please try again!")
 
-    match user_choice: 
-        case "1":
-            explore_catalog(data)
+def main() -> None:
+    
+    global _dirty
+
+    print("Welcome to the Cataloger of Household Objects!")
+
+    while True:
         
-        case "2":
-            search_object_in_catalog(data)
-            
-        case "3":
-            add_object_in_catalog(data, file_name)
+        display_menu_options()
+
+        while (user_choice := input("\nChoose an option: ").strip()) not in menu_options:
+            print("Invalid input. Please try again!")
+
+        match user_choice: 
+            case "1":
+                explore_catalog(data)
             
-        case "4":
-            modify_object_in_catalog(data, file_name)
+            case "2":
+                search_object_in_catalog(data)
+                
+            case "3":
+                _dirty |= add_object_in_catalog(data)
+                
+            case "4":
+                _dirty |= modify_object_in_catalog(data)
+                
+            case "5":
+                _dirty |= delete_object_from_catalog(data)
             
-        case "5":
-            delete_object_from_catalog(data, file_name)
+            case "0":
+                if save_catalog_if_dirty():
+                    break
+                
+                print("The catalog could not be saved. Your changes are kept; fix the problem and try again.")